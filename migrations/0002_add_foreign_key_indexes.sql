@@ -0,0 +1,7 @@
+-- Index foreign keys that are not already the leading column of a unique constraint.
+
+CREATE INDEX IF NOT EXISTS ix_people_family_id ON people (family_id);
+
+CREATE INDEX IF NOT EXISTS ix_person_locations_location_id ON person_locations (location_id);
+
+CREATE INDEX IF NOT EXISTS ix_relationships_to_person_id ON relationships (to_person_id);
@@ -1,6 +1,8 @@
 """Application configuration management."""
 
+import os
 from functools import lru_cache
+
 from pydantic import BaseModel, Field
 
 
@@ -12,6 +14,10 @@ class Settings(BaseModel):
         default="sqlite:///./family_tree.db",
         description="Database connection URL compatible with SQLAlchemy",
     )
+    create_schema_on_startup: bool = Field(
+        default_factory=lambda: os.environ.get("BOB_SKIP_CREATE_ALL") != "1",
+        description="Create missing tables at startup; set BOB_SKIP_CREATE_ALL=1 to disable",
+    )
 
 
 @lru_cache
@@ -1,17 +1,51 @@
 """Database session and engine setup."""
 
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from .config import get_settings
 
 settings = get_settings()
 
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Pick connection options for SQLite; other backends keep SQLAlchemy's defaults."""
+
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return {}
+    # Sessions are opened and used on different threadpool workers.
+    options: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if url.database in (None, "", ":memory:"):
+        # A memory database only lives as long as its connection, so share one.
+        options["poolclass"] = StaticPool
+    # File databases keep the default QueuePool: reused connections keep their page
+    # cache and skip re-running the connect-time PRAGMAs on every request.
+    return options
+
+
 engine = create_engine(
-    settings.database_url, echo=False, future=True
+    settings.database_url, echo=False, future=True, **_engine_options(settings.database_url)
 )
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        """Use WAL journaling so commits avoid a full journal rewrite and readers never block."""
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
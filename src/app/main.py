@@ -2,34 +2,59 @@
 
 from __future__ import annotations
 
-import asyncio
+import email.message
+import hashlib
 import html
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, TypeVar
 from urllib.parse import parse_qsl
 
-import httpx
 from fastapi import Depends, FastAPI, HTTPException, Request, status
-from fastapi.responses import HTMLResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import ValidationError
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import bindparam, lambda_stmt, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 from starlette.datastructures import FormData
 
 from . import models, schemas, services
 from .config import get_settings
 from .database import engine, get_session
 
-models.Base.metadata.create_all(bind=engine)
-
 settings = get_settings()
-app = FastAPI(title=settings.app_name)
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    if settings.create_schema_on_startup:
+        models.Base.metadata.create_all(bind=engine)
+    yield
+
+
+app = FastAPI(title=settings.app_name, lifespan=_lifespan)
 try:
-    templates = Jinja2Templates(directory=str(Path(__file__).resolve().parent / "templates"))
-except AssertionError:
+    import jinja2
+
+    # Compiled templates are cached on disk so new workers skip the parse step, and
+    # auto_reload is off so renders do not stat the template file each time.
+    templates = Jinja2Templates(
+        env=jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(Path(__file__).resolve().parent / "templates")),
+            autoescape=True,
+            auto_reload=False,
+            bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        )
+    )
+    # Compile the form template at import so the first request does not pay for it.
+    templates.get_template("person_form.html")
+except (ImportError, AssertionError):
     class _FallbackTemplates:
-        def TemplateResponse(self, template_name: str, context: dict) -> HTMLResponse:
+        def TemplateResponse(
+            self, request: Request, template_name: str, context: dict
+        ) -> HTMLResponse:
             message = context.get("message")
             message_type = context.get("message_type", "")
             parts = ["<html><body>"]
@@ -43,104 +68,258 @@ except AssertionError:
     templates = _FallbackTemplates()
 
 
-def _clean_optional(value: str | None) -> str | None:
-    if value is None:
-        return None
-    value = value.strip()
-    return value or None
+ModelT = TypeVar("ModelT")
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
 
+# Families are few and small, so one joined query beats a SELECT ... IN round-trip
+# per level of the member/location chain.
+_FAMILY_LOAD_OPTIONS = (
+    joinedload(models.Family.members)
+    .joinedload(models.Person.locations)
+    .joinedload(models.PersonLocation.location),
+    raiseload("*"),
+)
+_PERSON_LOCATIONS_LOAD = selectinload(models.Person.locations).selectinload(
+    models.PersonLocation.location
+)
+_PERSON_LOAD_OPTIONS = (_PERSON_LOCATIONS_LOAD, raiseload("*"))
+# Read statements are built once as lambda statements, so each request reuses the
+# cached construct and its cache key instead of rebuilding the select.
+_SELECT_FAMILIES = lambda_stmt(lambda: select(models.Family).options(*_FAMILY_LOAD_OPTIONS))
+_SELECT_FAMILY_BY_ID = lambda_stmt(
+    lambda: select(models.Family)
+    .options(*_FAMILY_LOAD_OPTIONS)
+    .where(models.Family.id == bindparam("family_id"))
+)
+_SELECT_PEOPLE = lambda_stmt(lambda: select(models.Person).options(*_PERSON_LOAD_OPTIONS))
+_SELECT_PERSON_BY_ID = lambda_stmt(
+    lambda: select(models.Person)
+    .options(*_PERSON_LOAD_OPTIONS)
+    .where(models.Person.id == bindparam("person_id"))
+)
+_SELECT_LOCATION_ROWS = lambda_stmt(lambda: select(models.Location.__table__))
+_SELECT_RELATIONSHIP_ROWS = lambda_stmt(lambda: select(models.Relationship.__table__))
+_SELECT_FORM_FAMILIES = lambda_stmt(lambda: select(models.Family))
+_SELECT_FORM_LOCATIONS = lambda_stmt(lambda: select(models.Location))
+
+# Rows fetched per round of the streaming list endpoints.
+_STREAM_BATCH_SIZE = 500
+_LOCATION_ROLE_METADATA: tuple[Dict[str, str], ...] = tuple(
+    {"value": role.value, "label": role.value.replace("_", " ").title()}
+    for role in models.LocationRole
+)
+_NEW_LOCATION_DETAIL_FIELDS = ("description", "city", "state", "country")
+# Form field names per role, built once: (role, label, id key, name key, ((field, key), ...)).
+_LOCATION_ROLE_FORM_KEYS: tuple[tuple[Any, ...], ...] = tuple(
+    (
+        meta["value"],
+        meta["label"],
+        f"{meta['value']}_location_id",
+        f"{meta['value']}_location_name",
+        tuple(
+            (field, f"{meta['value']}_location_{field}") for field in _NEW_LOCATION_DETAIL_FIELDS
+        ),
+    )
+    for meta in _LOCATION_ROLE_METADATA
+)
 
-def _extract_error_detail(response: httpx.Response) -> str:
-    try:
-        data = response.json()
-    except ValueError:
-        return response.text or response.reason_phrase
-
-    detail = data.get("detail")
-    if detail is None:
-        return response.text
-    if isinstance(detail, list):
-        messages = []
-        for entry in detail:
-            if isinstance(entry, dict):
-                messages.append(str(entry.get("msg") or entry))
-            else:
-                messages.append(str(entry))
-        return "; ".join(messages)
-    return str(detail)
-
-
-def _location_role_metadata() -> List[Dict[str, str]]:
-    return [
-        {
-            "value": role.value,
-            "label": role.value.replace("_", " ").title(),
-        }
-        for role in models.LocationRole
-    ]
-
-
-async def _fetch_reference_data() -> tuple[List[dict], List[dict]]:
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
-        families_response, locations_response = await asyncio.gather(
-            client.get("/families"), client.get("/locations")
-        )
 
-    families = families_response.json() if families_response.status_code == status.HTTP_200_OK else []
-    locations = (
-        locations_response.json()
-        if locations_response.status_code == status.HTTP_200_OK
-        else []
+def _update_by_id(
+    session: Session,
+    model: type[ModelT],
+    object_id: int,
+    values: dict[str, Any],
+    options: Sequence[Any] = (),
+) -> ModelT | None:
+    """Apply ``values`` in one UPDATE ... RETURNING, or just load the row if nothing is set.
+
+    ``options`` are loader options applied to the returned object.
+    """
+
+    if not values:
+        return session.get(model, object_id, options=options)
+    statement = (
+        update(model)
+        .where(model.id == object_id)
+        .values(**values)
+        .returning(model)
+        .options(*options)
     )
-    return families, locations
+    return session.scalars(statement).one_or_none()
+
+
+def _commit_as(session: Session, schema: type[SchemaT], obj: Any) -> SchemaT:
+    """Serialise ``obj`` with ``schema``, then commit.
+
+    Commit expires every loaded object, so validating first lets write routes answer from
+    the rows their INSERT/UPDATE ... RETURNING (or flush) already loaded, without a refresh
+    SELECT after the commit.
+    """
+
+    result = schema.model_validate(obj)
+    session.commit()
+    return result
+
+
+def _conditional_json_response(request: Request, body: bytes) -> Response:
+    """Serve ``body`` with a content-derived ETag, or a bare 304 if the client already has it."""
+
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _stream_json_array(
+    adapter: TypeAdapter[List[Any]], batches: Iterable[Sequence[Any]]
+) -> StreamingResponse:
+    """Stream ``batches`` as one JSON array, holding only a single batch in memory.
+
+    The body is produced after the handler returns, so ``batches`` may keep reading from
+    the request's ``get_session`` Session: FastAPI 0.118+ closes it only once the response
+    has been sent.
+    """
+
+    def encode() -> Iterator[bytes]:
+        separator = b"["
+        for batch in batches:
+            body = adapter.dump_json(adapter.validate_python(batch, from_attributes=True))
+            if len(body) > 2:
+                yield separator + body[1:-1]
+                separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+    return StreamingResponse(encode(), media_type="application/json")
+
+
+def _fetch_reference_data(
+    session: Session,
+) -> tuple[List[models.Family], List[models.Location]]:
+    # The template only reads attributes, so ORM rows are passed through unconverted.
+    families = session.scalars(_SELECT_FORM_FAMILIES).all()
+    locations = session.scalars(_SELECT_FORM_LOCATIONS).all()
+    return list(families), list(locations)
+
+
+def _is_json_content_type(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    subtype = message.get_content_subtype()
+    return message.get_content_maintype() == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+async def _person_create_payload(request: Request) -> schemas.PersonCreate:
+    """Validate the POST /people body straight from bytes with pydantic-core's JSON parser."""
+
+    body = await request.body()
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    if not _is_json_content_type(request.headers.get("content-type")):
+        # Match FastAPI's typed bodies, which refuse non-JSON media types so a cross-site
+        # "simple" form post cannot create records.
+        raise RequestValidationError(
+            [
+                {
+                    "type": "model_attributes_type",
+                    "loc": ("body",),
+                    "msg": "Input should be a valid dictionary or object to extract fields from",
+                    "input": body,
+                }
+            ]
+        )
+    try:
+        return schemas.PersonCreate.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        ) from None
+
+
+# The body is parsed by a dependency, so FastAPI does not see PersonCreate. The route
+# references it as a component, and _openapi registers that component with its $defs.
+_PERSON_CREATE_SCHEMA = schemas.PersonCreate.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_PERSON_CREATE_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"$ref": "#/components/schemas/PersonCreate"}}
+        },
+    }
+}
+
+
+async def _read_form(request: Request) -> FormData:
+    """Parse the submitted form, decoding urlencoded bodies without Starlette's form parser.
 
+    Used as a dependency so the body is read on the event loop while the sync form handler
+    runs in the threadpool.
+    """
 
-async def _render_person_form(
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("application/x-www-form-urlencoded"):
+        return await request.form()
+
+    body_bytes = await request.body()
+    charset = content_type.split("charset=")
+    encoding = charset[1] if len(charset) > 1 else "utf-8"
+    try:
+        decoded = body_bytes.decode(encoding)
+    except LookupError:
+        decoded = body_bytes.decode("utf-8")
+    return FormData(parse_qsl(decoded, keep_blank_values=True))
+
+
+def _render_person_form(
     request: Request,
+    session: Session,
     *,
     message: str | None = None,
     message_type: str = "success",
     form_values: Dict[str, str] | None = None,
-    created_person: dict | None = None,
+    created_person: models.Person | None = None,
 ) -> HTMLResponse:
-    families, locations = await _fetch_reference_data()
+    families, locations = _fetch_reference_data(session)
     context = {
-        "request": request,
         "families": families,
         "locations": locations,
-        "location_roles": _location_role_metadata(),
+        "location_roles": _LOCATION_ROLE_METADATA,
         "message": message,
         "message_type": message_type,
         "form_values": form_values or {},
         "created_person": created_person,
     }
-    return templates.TemplateResponse("person_form.html", context)
+    return templates.TemplateResponse(request, "person_form.html", context)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def person_form(request: Request) -> HTMLResponse:
-    return await _render_person_form(request, message_type="success")
+def person_form(request: Request, session: Session = Depends(get_session)) -> HTMLResponse:
+    return _render_person_form(request, session, message_type="success")
 
 
 @app.post("/ui/people", response_class=HTMLResponse)
-async def submit_person_form(request: Request) -> HTMLResponse:
-    try:
-        form = await request.form()
-    except AssertionError as exc:
-        if "python-multipart" not in str(exc).lower():
-            raise
-        body_bytes = await request.body()
-        charset = request.headers.get("content-type", "").split("charset=")
-        encoding = charset[1] if len(charset) > 1 else "utf-8"
-        try:
-            decoded = body_bytes.decode(encoding)
-        except LookupError:
-            decoded = body_bytes.decode("utf-8")
-        form = FormData(parse_qsl(decoded, keep_blank_values=True))
+def submit_person_form(
+    request: Request,
+    form: FormData = Depends(_read_form),
+    session: Session = Depends(get_session),
+) -> HTMLResponse:
     form_values = dict(form.multi_items())
-    first_name = (form.get("first_name") or "").strip()
-    last_name = (form.get("last_name") or "").strip()
+    # Blank or whitespace-only fields are treated as missing.
+    cleaned: Dict[str, str | None] = {
+        key: value.strip() or None for key, value in form_values.items() if isinstance(value, str)
+    }
+    first_name = cleaned.get("first_name") or ""
+    last_name = cleaned.get("last_name") or ""
 
     errors: List[str] = []
     if not first_name:
@@ -148,13 +327,13 @@ async def submit_person_form(request: Request) -> HTMLResponse:
     if not last_name:
         errors.append("Last name is required.")
 
-    birth_date = _clean_optional(form.get("birth_date"))
-    death_date = _clean_optional(form.get("death_date"))
-    biography = _clean_optional(form.get("biography"))
+    birth_date = cleaned.get("birth_date")
+    death_date = cleaned.get("death_date")
+    biography = cleaned.get("biography")
 
-    existing_family_id_raw = _clean_optional(form.get("existing_family_id"))
-    new_family_name = _clean_optional(form.get("new_family_name"))
-    new_family_description = _clean_optional(form.get("new_family_description"))
+    existing_family_id_raw = cleaned.get("existing_family_id")
+    new_family_name = cleaned.get("new_family_name")
+    new_family_description = cleaned.get("new_family_description")
 
     family_id: int | None = None
 
@@ -169,21 +348,14 @@ async def submit_person_form(request: Request) -> HTMLResponse:
 
     location_assignments: List[dict] = []
     if not errors:
-        for role_meta in _location_role_metadata():
-            role_value = role_meta["value"]
-            label = role_meta["label"]
-            existing_location_raw = _clean_optional(form.get(f"{role_value}_location_id"))
-            new_location_name = _clean_optional(form.get(f"{role_value}_location_name"))
+        for role_value, label, id_key, name_key, detail_keys in _LOCATION_ROLE_FORM_KEYS:
+            existing_location_raw = cleaned.get(id_key)
+            new_location_name = cleaned.get(name_key)
 
             if new_location_name:
                 new_location_payload = {
                     "name": new_location_name,
-                    "description": _clean_optional(
-                        form.get(f"{role_value}_location_description")
-                    ),
-                    "city": _clean_optional(form.get(f"{role_value}_location_city")),
-                    "state": _clean_optional(form.get(f"{role_value}_location_state")),
-                    "country": _clean_optional(form.get(f"{role_value}_location_country")),
+                    **{field: cleaned.get(key) for field, key in detail_keys},
                 }
                 location_assignments.append(
                     {"role": role_value, "new_location": new_location_payload}
@@ -200,8 +372,9 @@ async def submit_person_form(request: Request) -> HTMLResponse:
 
     if errors:
         message = " ".join(errors)
-        return await _render_person_form(
+        return _render_person_form(
             request,
+            session,
             message=message,
             message_type="error",
             form_values=form_values,
@@ -227,39 +400,55 @@ async def submit_person_form(request: Request) -> HTMLResponse:
             else:
                 messages.append(str(error.get("msg")))
         message = "; ".join(messages) or "Invalid data provided."
-        return await _render_person_form(
+        return _render_person_form(
             request,
+            session,
             message=message,
             message_type="error",
             form_values=form_values,
         )
 
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
-        person_response = await client.post(
-            "/people", json=person_payload.model_dump(mode="json")
-        )
-
-    if person_response.status_code == status.HTTP_201_CREATED:
-        person_data = person_response.json()
-        message = f"Created {person_data['first_name']} {person_data['last_name']}."
-        return await _render_person_form(
+    try:
+        person = services.create_person(session, person_payload)
+        session.commit()
+    except HTTPException as exc:
+        session.rollback()
+        return _render_person_form(
             request,
-            message=message,
-            message_type="success",
-            form_values={},
-            created_person=person_data,
+            session,
+            message=f"Could not create person: {exc.detail}",
+            message_type="error",
+            form_values=form_values,
         )
 
-    error_detail = _extract_error_detail(person_response)
-    return await _render_person_form(
+    return _render_person_form(
         request,
-        message=f"Could not create person: {error_detail}",
-        message_type="error",
-        form_values=form_values,
+        session,
+        message=f"Created {person.first_name} {person.last_name}.",
+        message_type="success",
+        form_values={},
+        created_person=person,
     )
 
 
+_default_openapi = app.openapi
+
+
+def _openapi() -> Dict[str, Any]:
+    if app.openapi_schema is None:
+        component_schemas = _default_openapi().setdefault("components", {}).setdefault(
+            "schemas", {}
+        )
+        person_create = dict(_PERSON_CREATE_SCHEMA)
+        for name, definition in person_create.pop("$defs", {}).items():
+            component_schemas.setdefault(name, definition)
+        component_schemas.setdefault("PersonCreate", person_create)
+    return app.openapi_schema
+
+
+app.openapi = _openapi  # type: ignore[method-assign]
+
+
 # Families --------------------------------------------------------------------
 
 
@@ -267,37 +456,22 @@ async def submit_person_form(request: Request) -> HTMLResponse:
 def create_family(
     payload: schemas.FamilyCreate, session: Session = Depends(get_session)
 ) -> schemas.FamilyRead:
-    family = models.Family(**payload.model_dump())
-    session.add(family)
-    session.commit()
-    session.refresh(family)
-    return family
+    return _commit_as(session, schemas.FamilyRead, services.create_family(session, payload))
 
 
 @app.get("/families", response_model=List[schemas.FamilyDetail])
-def list_families(session: Session = Depends(get_session)) -> List[schemas.FamilyDetail]:
-    families_query = select(models.Family).options(
-        selectinload(models.Family.members)
-        .selectinload(models.Person.locations)
-        .selectinload(models.PersonLocation.location)
+def list_families(request: Request, session: Session = Depends(get_session)) -> Response:
+    families = schemas.FamilyListAdapter.validate_python(
+        session.scalars(_SELECT_FAMILIES).unique().all(), from_attributes=True
     )
-    return list(session.scalars(families_query))
+    return _conditional_json_response(request, schemas.FamilyListAdapter.dump_json(families))
 
 
 @app.get("/families/{family_id}", response_model=schemas.FamilyDetail)
 def get_family(
     family_id: int, session: Session = Depends(get_session)
 ) -> schemas.FamilyDetail:
-    family_query = (
-        select(models.Family)
-        .options(
-            selectinload(models.Family.members)
-            .selectinload(models.Person.locations)
-            .selectinload(models.PersonLocation.location)
-        )
-        .where(models.Family.id == family_id)
-    )
-    family = session.scalars(family_query).first()
+    family = session.scalars(_SELECT_FAMILY_BY_ID, {"family_id": family_id}).unique().first()
     if family is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Family not found")
     return family
@@ -309,17 +483,12 @@ def update_family(
     payload: schemas.FamilyUpdate,
     session: Session = Depends(get_session),
 ) -> schemas.FamilyRead:
-    family = session.get(models.Family, family_id)
+    family = _update_by_id(
+        session, models.Family, family_id, services.provided_fields(payload)
+    )
     if family is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Family not found")
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(family, key, value)
-
-    session.commit()
-    session.refresh(family)
-    return family
+    return _commit_as(session, schemas.FamilyRead, family)
 
 
 @app.delete("/families/{family_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -338,16 +507,14 @@ def delete_family(family_id: int, session: Session = Depends(get_session)) -> No
 def create_location(
     payload: schemas.LocationCreate, session: Session = Depends(get_session)
 ) -> schemas.LocationRead:
-    location = models.Location(**payload.model_dump())
-    session.add(location)
-    session.commit()
-    session.refresh(location)
-    return location
+    return _commit_as(session, schemas.LocationRead, services.create_location(session, payload))
 
 
 @app.get("/locations", response_model=List[schemas.LocationRead])
-def list_locations(session: Session = Depends(get_session)) -> List[schemas.LocationRead]:
-    return list(session.scalars(select(models.Location)))
+def list_locations(request: Request, session: Session = Depends(get_session)) -> Response:
+    rows = session.execute(_SELECT_LOCATION_ROWS).mappings()
+    locations = [schemas.LocationRead.model_construct(**row) for row in rows]
+    return _conditional_json_response(request, schemas.LocationListAdapter.dump_json(locations))
 
 
 @app.get("/locations/{location_id}", response_model=schemas.LocationRead)
@@ -366,78 +533,48 @@ def update_location(
     payload: schemas.LocationUpdate,
     session: Session = Depends(get_session),
 ) -> schemas.LocationRead:
-    location = session.get(models.Location, location_id)
+    location = _update_by_id(
+        session, models.Location, location_id, services.provided_fields(payload)
+    )
     if location is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location not found")
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(location, key, value)
-
-    session.commit()
-    session.refresh(location)
-    return location
+    return _commit_as(session, schemas.LocationRead, location)
 
 
 @app.delete("/locations/{location_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_location(location_id: int, session: Session = Depends(get_session)) -> None:
-    location = session.get(models.Location, location_id)
-    if location is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location not found")
-    session.delete(location)
+    services.delete_location(session, location_id)
     session.commit()
 
 
 # People ----------------------------------------------------------------------
 
 
-def _ensure_family_exists(session: Session, family_id: int | None) -> None:
-    if family_id is None:
-        return
-    family = session.get(models.Family, family_id)
-    if family is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Family not found")
-
-
-@app.post("/people", response_model=schemas.PersonRead, status_code=status.HTTP_201_CREATED)
+@app.post(
+    "/people",
+    response_model=schemas.PersonRead,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_PERSON_CREATE_OPENAPI,
+)
 def create_person(
-    payload: schemas.PersonCreate, session: Session = Depends(get_session)
+    payload: schemas.PersonCreate = Depends(_person_create_payload),
+    session: Session = Depends(get_session),
 ) -> schemas.PersonRead:
-    if payload.family is not None and payload.family_id is not None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Provide either family_id or family payload, not both",
-        )
-
-    family_id = payload.family_id
-    if payload.family is not None:
-        family = models.Family(**payload.family.model_dump())
-        session.add(family)
-        session.flush()
-        family_id = family.id
-    else:
-        _ensure_family_exists(session, family_id)
-
-    data = payload.model_dump(exclude={"locations", "family", "family_id"})
-    data["family_id"] = family_id
-    person = models.Person(**data)
-    session.add(person)
-    session.flush()
-
-    services.apply_person_locations(session, person, payload.locations)
+    person = services.create_person(session, payload)
     session.commit()
     session.refresh(person)
     return person
 
 
 @app.get("/people", response_model=List[schemas.PersonRead])
-def list_people(session: Session = Depends(get_session)) -> List[schemas.PersonRead]:
-    return list(session.scalars(select(models.Person)))
+def list_people(session: Session = Depends(get_session)) -> Response:
+    people = session.scalars(_SELECT_PEOPLE, execution_options={"yield_per": _STREAM_BATCH_SIZE})
+    return _stream_json_array(schemas.PersonListAdapter, people.partitions())
 
 
 @app.get("/people/{person_id}", response_model=schemas.PersonRead)
 def get_person(person_id: int, session: Session = Depends(get_session)) -> schemas.PersonRead:
-    person = session.get(models.Person, person_id)
+    person = session.scalars(_SELECT_PERSON_BY_ID, {"person_id": person_id}).first()
     if person is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
     return person
@@ -449,31 +586,29 @@ def update_person(
     payload: schemas.PersonUpdate,
     session: Session = Depends(get_session),
 ) -> schemas.PersonRead:
-    person = session.get(models.Person, person_id)
-    if person is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
-
     if payload.family_id is not None:
-        _ensure_family_exists(session, payload.family_id)
-
-    update_data = payload.model_dump(exclude_unset=True, exclude={"locations"})
-    for key, value in update_data.items():
-        setattr(person, key, value)
+        services.ensure_family_exists(session, payload.family_id)
 
-    if payload.locations is not None:
-        services.apply_person_locations(session, person, payload.locations)
-
-    session.commit()
-    session.refresh(person)
-    return person
+    values = services.provided_fields(payload, exclude={"locations"})
+    if payload.locations is None:
+        person = _update_by_id(session, models.Person, person_id, values, _PERSON_LOAD_OPTIONS)
+    else:
+        # apply_person_locations diffs against the current links, so load them up front.
+        person = session.get(models.Person, person_id, options=[_PERSON_LOCATIONS_LOAD])
+        if person is not None:
+            for key, value in values.items():
+                setattr(person, key, value)
+            services.apply_person_locations(session, person, payload.locations)
+            # New links and locations need their ids before the response is built.
+            session.flush()
+    if person is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
+    return _commit_as(session, schemas.PersonRead, person)
 
 
 @app.delete("/people/{person_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_person(person_id: int, session: Session = Depends(get_session)) -> None:
-    person = session.get(models.Person, person_id)
-    if person is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
-    session.delete(person)
+    services.delete_person(session, person_id)
     session.commit()
 
 
@@ -488,17 +623,17 @@ def delete_person(person_id: int, session: Session = Depends(get_session)) -> No
 def create_relationship(
     payload: schemas.RelationshipCreate, session: Session = Depends(get_session)
 ) -> schemas.RelationshipRead:
-    relationship = services.create_relationship(session, payload)
-    session.commit()
-    session.refresh(relationship)
-    return relationship
+    return _commit_as(
+        session, schemas.RelationshipRead, services.create_relationship(session, payload)
+    )
 
 
 @app.get("/relationships", response_model=List[schemas.RelationshipRead])
-def list_relationships(
-    session: Session = Depends(get_session),
-) -> List[schemas.RelationshipRead]:
-    return list(session.scalars(select(models.Relationship)))
+def list_relationships(session: Session = Depends(get_session)) -> Response:
+    rows = session.execute(
+        _SELECT_RELATIONSHIP_ROWS, execution_options={"yield_per": _STREAM_BATCH_SIZE}
+    )
+    return _stream_json_array(schemas.RelationshipListAdapter, rows.partitions())
 
 
 @app.put("/relationships/{relationship_id}", response_model=schemas.RelationshipRead)
@@ -510,20 +645,16 @@ def update_relationship(
     relationship = session.get(models.Relationship, relationship_id)
     if relationship is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Relationship not found")
-
-    relationship = services.update_relationship(session, relationship, payload)
-    session.commit()
-    session.refresh(relationship)
-    return relationship
+    return _commit_as(
+        session,
+        schemas.RelationshipRead,
+        services.update_relationship(session, relationship, payload),
+    )
 
 
 @app.delete("/relationships/{relationship_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_relationship(
     relationship_id: int, session: Session = Depends(get_session)
 ) -> None:
-    relationship = session.get(models.Relationship, relationship_id)
-    if relationship is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Relationship not found")
-
-    services.delete_relationship(session, relationship)
+    services.delete_relationship(session, relationship_id)
     session.commit()
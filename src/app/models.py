@@ -5,8 +5,14 @@ from __future__ import annotations
 from datetime import date
 import enum
 
-from sqlalchemy import Date, Enum, ForeignKey, Integer, String, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
+from sqlalchemy import Date, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import (
+    Mapped,
+    attribute_keyed_dict,
+    declarative_base,
+    mapped_column,
+    relationship,
+)
 
 Base = declarative_base()
 
@@ -52,7 +58,9 @@ class Person(Base):
     birth_date: Mapped[date | None] = mapped_column(Date())
     death_date: Mapped[date | None] = mapped_column(Date())
     biography: Mapped[str | None] = mapped_column(Text())
-    family_id: Mapped[int | None] = mapped_column(ForeignKey("families.id"), nullable=True)
+    family_id: Mapped[int | None] = mapped_column(
+        ForeignKey("families.id"), nullable=True, index=True
+    )
 
     family: Mapped[Family | None] = relationship(back_populates="members")
     relationships_from: Mapped[list["Relationship"]] = relationship(
@@ -65,8 +73,11 @@ class Person(Base):
         foreign_keys="Relationship.to_person_id",
         cascade="all, delete-orphan",
     )
-    locations: Mapped[list["PersonLocation"]] = relationship(
-        back_populates="person", cascade="all, delete-orphan"
+    # Keyed by role: a person has at most one link per role (uq_person_location_role).
+    locations: Mapped[dict[str, "PersonLocation"]] = relationship(
+        back_populates="person",
+        cascade="all, delete-orphan",
+        collection_class=attribute_keyed_dict("role"),
     )
 
 
@@ -80,10 +91,13 @@ class Relationship(Base):
         ForeignKey("people.id", ondelete="CASCADE"), nullable=False
     )
     to_person_id: Mapped[int] = mapped_column(
-        ForeignKey("people.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("people.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    type: Mapped[RelationshipType] = mapped_column(Enum(RelationshipType), nullable=False)
+    # A RelationshipType value stored as a plain string, so loads skip any result processor.
+    # Loaded rows hold ``str``; RelationshipType members compare and hash equal to it.
+    type: Mapped[str] = mapped_column(String(50), nullable=False)
 
+    # from_person_id lookups are served by the leading column of uq_relationship_pair.
     __table_args__ = (
         UniqueConstraint(
             "from_person_id", "to_person_id", "type", name="uq_relationship_pair"
@@ -125,10 +139,12 @@ class PersonLocation(Base):
         ForeignKey("people.id", ondelete="CASCADE"), nullable=False
     )
     location_id: Mapped[int] = mapped_column(
-        ForeignKey("locations.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("locations.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    role: Mapped[LocationRole] = mapped_column(Enum(LocationRole), nullable=False)
+    # A LocationRole value stored as a plain string; see Relationship.type.
+    role: Mapped[str] = mapped_column(String(50), nullable=False)
 
+    # person_id lookups are served by the leading column of uq_person_location_role.
     __table_args__ = (
         UniqueConstraint("person_id", "role", name="uq_person_location_role"),
     )
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
 from .models import LocationRole, RelationshipType
 
 
+class _ReadBase(BaseModel):
+    """Shared configuration for response models populated from ORM objects."""
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
 class LocationBase(BaseModel):
     name: str = Field(..., max_length=128)
     description: Optional[str] = None
@@ -30,11 +36,9 @@ class LocationUpdate(BaseModel):
     country: Optional[str] = Field(default=None, max_length=128)
 
 
-class LocationRead(LocationBase):
+class LocationRead(LocationBase, _ReadBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class PersonLocationAssignment(BaseModel):
     role: LocationRole
@@ -52,12 +56,10 @@ class PersonLocationAssignment(BaseModel):
         return self
 
 
-class PersonLocationRead(BaseModel):
+class PersonLocationRead(_ReadBase):
     role: LocationRole
     location: LocationRead
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class PersonBase(BaseModel):
     first_name: str = Field(..., max_length=64)
@@ -91,11 +93,15 @@ class PersonUpdate(BaseModel):
     locations: Optional[List[PersonLocationAssignment]] = None
 
 
-class PersonRead(PersonBase):
+class PersonRead(PersonBase, _ReadBase):
     id: int
     locations: List[PersonLocationRead] = Field(default_factory=list)
 
-    model_config = ConfigDict(from_attributes=True)
+    @field_validator("locations", mode="before")
+    @classmethod
+    def _list_role_keyed_locations(cls, value: Any) -> Any:
+        # Person.locations is a role-keyed mapping on the ORM side; responses list the links.
+        return list(value.values()) if isinstance(value, dict) else value
 
 
 class FamilyBase(BaseModel):
@@ -112,17 +118,13 @@ class FamilyUpdate(BaseModel):
     description: Optional[str] = None
 
 
-class FamilyRead(FamilyBase):
+class FamilyRead(FamilyBase, _ReadBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class FamilyDetail(FamilyRead):
     members: List[PersonRead] = Field(default_factory=list)
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class RelationshipBase(BaseModel):
     from_person_id: int
@@ -138,7 +140,12 @@ class RelationshipUpdate(BaseModel):
     type: RelationshipType
 
 
-class RelationshipRead(RelationshipBase):
+class RelationshipRead(RelationshipBase, _ReadBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
+
+# List adapters are built once so list endpoints reuse the compiled validators and serializers.
+FamilyListAdapter = TypeAdapter(List[FamilyDetail])
+LocationListAdapter = TypeAdapter(List[LocationRead])
+PersonListAdapter = TypeAdapter(List[PersonRead])
+RelationshipListAdapter = TypeAdapter(List[RelationshipRead])
@@ -2,25 +2,86 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import and_, delete, exists, insert, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from . import models, schemas
 
+# Every relationship type has a reciprocal, so lookups index the mapping directly.
 RECIPROCAL_RELATIONSHIPS: dict[models.RelationshipType, models.RelationshipType] = {
     models.RelationshipType.parent: models.RelationshipType.child,
     models.RelationshipType.child: models.RelationshipType.parent,
     models.RelationshipType.spouse: models.RelationshipType.spouse,
 }
 
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING against uq_relationship_pair.
+_CONFLICT_IGNORING_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
 
-def _get_person(session: Session, person_id: int) -> models.Person:
-    person = session.get(models.Person, person_id)
-    if person is None:
+
+def provided_fields(payload: BaseModel, exclude: Collection[str] = ()) -> dict[str, Any]:
+    """Return the fields explicitly set on ``payload`` without a ``model_dump`` walk."""
+
+    return {
+        name: getattr(payload, name) for name in payload.model_fields_set if name not in exclude
+    }
+
+
+def _ensure_people_exist(session: Session, *person_ids: int) -> None:
+    found = set(session.scalars(select(models.Person.id).where(models.Person.id.in_(person_ids))))
+    if not found.issuperset(person_ids):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
+
+
+def ensure_family_exists(session: Session, family_id: int | None) -> None:
+    """Raise a 404 unless ``family_id`` is empty or references a stored family."""
+
+    if family_id is None:
+        return
+    if not session.scalar(select(exists().where(models.Family.id == family_id))):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Family not found")
+
+
+def create_family(session: Session, payload: schemas.FamilyCreate) -> models.Family:
+    """Insert a new family, loading the stored row back through ``RETURNING``."""
+
+    stmt = insert(models.Family).values(**provided_fields(payload)).returning(models.Family)
+    return session.scalars(stmt).one()
+
+
+def create_location(session: Session, payload: schemas.LocationCreate) -> models.Location:
+    """Insert a new location, loading the stored row back through ``RETURNING``."""
+
+    stmt = insert(models.Location).values(**provided_fields(payload)).returning(models.Location)
+    return session.scalars(stmt).one()
+
+
+def create_person(session: Session, payload: schemas.PersonCreate) -> models.Person:
+    """Create a person along with an optional inline family and location links."""
+
+    if payload.family is not None and payload.family_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide either family_id or family payload, not both",
+        )
+
+    ensure_family_exists(session, payload.family_id)
+
+    person = models.Person(**provided_fields(payload, exclude={"locations", "family"}))
+    if payload.family is not None:
+        # Linking through the relationship lets the unit of work insert the
+        # family, the person and its locations in a single flush.
+        person.family = models.Family(
+            name=payload.family.name, description=payload.family.description
+        )
+    session.add(person)
+
+    apply_person_locations(session, person, payload.locations)
     return person
 
 
@@ -29,42 +90,73 @@ def apply_person_locations(
 ) -> None:
     """Synchronize person location associations with supplied assignments."""
 
-    materialized = list(assignments)
-
-    seen_roles: set[models.LocationRole] = set()
-    for assignment in materialized:
-        if assignment.role in seen_roles:
+    # One pass rejects repeated roles and collects the referenced location ids. by_role also
+    # serves as the requested-role lookup, so no role set is built; requested_ids is the only
+    # set, and it feeds the IN query.
+    by_role: dict[models.LocationRole, schemas.PersonLocationAssignment] = {}
+    requested_ids: set[int] = set()
+    for assignment in assignments:
+        if assignment.role in by_role:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Duplicate location role '{assignment.role.value}' in request",
             )
-        seen_roles.add(assignment.role)
-
-    existing_by_role = {link.role: link for link in person.locations}
-    requested_roles = {assignment.role for assignment in materialized}
+        by_role[assignment.role] = assignment
+        if assignment.new_location is None:
+            requested_ids.add(assignment.location_id)
+
+    locations_by_id: dict[int, models.Location] = {}
+    if requested_ids:
+        locations_by_id = {
+            location.id: location
+            for location in session.scalars(
+                select(models.Location).where(models.Location.id.in_(requested_ids))
+            )
+        }
+        for assignment in by_role.values():
+            if assignment.new_location is None and assignment.location_id not in locations_by_id:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Location {assignment.location_id} not found",
+                )
 
-    # Remove roles that are no longer present
-    for role, link in list(existing_by_role.items()):
-        if role not in requested_roles:
-            session.delete(link)
+    # Person.locations is already keyed by role. Snapshot it: the stale-role DELETE below
+    # expires the collection, and the lookups must not read the expired mapping.
+    existing_by_role = dict(person.locations)
+
+    # Remove roles that are no longer present in one statement, then drop the stale
+    # collection so later access reloads it instead of listing the deleted links.
+    stale_roles = [role for role in existing_by_role if role not in by_role]
+    if stale_roles:
+        session.execute(
+            delete(models.PersonLocation).where(
+                models.PersonLocation.person_id == person.id,
+                models.PersonLocation.role.in_(stale_roles),
+            )
+        )
+        session.expire(person, ["locations"])
 
-    for assignment in materialized:
+    for role, assignment in by_role.items():
         if assignment.new_location is not None:
-            location = models.Location(**assignment.new_location.model_dump())
+            # Left unflushed: the caller's single flush or commit inserts every new location.
+            # SQLite cannot order a multi-row RETURNING, so each still gets its own INSERT.
+            new_location = assignment.new_location
+            location = models.Location(
+                name=new_location.name,
+                description=new_location.description,
+                city=new_location.city,
+                state=new_location.state,
+                country=new_location.country,
+            )
             session.add(location)
-            session.flush()
         else:
-            location = session.get(models.Location, assignment.location_id)
-            if location is None:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Location {assignment.location_id} not found",
-                )
-        link = existing_by_role.get(assignment.role)
+            location = locations_by_id[assignment.location_id]
+        link = existing_by_role.get(role)
         if link is None:
-            link = models.PersonLocation(person=person, location=location, role=assignment.role)
+            # The role must be set before the link joins the role-keyed collection.
+            link = models.PersonLocation(role=role, location=location)
+            link.person = person
             session.add(link)
-            existing_by_role[assignment.role] = link
         else:
             link.location = location
 
@@ -80,32 +172,56 @@ def create_relationship(
             detail="Cannot create relationship with the same person",
         )
 
-    _get_person(session, payload.from_person_id)
-    _get_person(session, payload.to_person_id)
-
-    existing = session.scalar(
-        select(models.Relationship).where(
-            models.Relationship.from_person_id == payload.from_person_id,
-            models.Relationship.to_person_id == payload.to_person_id,
-            models.Relationship.type == payload.type,
+    _ensure_people_exist(session, payload.from_person_id, payload.to_person_id)
+
+    reciprocal_type = RECIPROCAL_RELATIONSHIPS[payload.type]
+    # One probe covers both the duplicate check and an already-present reciprocal; the two
+    # candidate rows are told apart by their from_person_id.
+    existing_from_ids = set(
+        session.scalars(
+            select(models.Relationship.from_person_id).where(
+                or_(
+                    and_(
+                        models.Relationship.from_person_id == payload.from_person_id,
+                        models.Relationship.to_person_id == payload.to_person_id,
+                        models.Relationship.type == payload.type,
+                    ),
+                    and_(
+                        models.Relationship.from_person_id == payload.to_person_id,
+                        models.Relationship.to_person_id == payload.from_person_id,
+                        models.Relationship.type == reciprocal_type,
+                    ),
+                )
+            )
         )
     )
-    if existing:
+    if payload.from_person_id in existing_from_ids:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Relationship already exists",
         )
 
-    relationship = models.Relationship(
-        from_person_id=payload.from_person_id,
-        to_person_id=payload.to_person_id,
-        type=payload.type,
-    )
-    session.add(relationship)
-
-    _ensure_reciprocal(session, relationship)
-    session.flush()
-    return relationship
+    rows = [
+        {
+            "from_person_id": payload.from_person_id,
+            "to_person_id": payload.to_person_id,
+            "type": payload.type,
+        }
+    ]
+    if payload.to_person_id not in existing_from_ids:
+        rows.append(
+            {
+                "from_person_id": payload.to_person_id,
+                "to_person_id": payload.from_person_id,
+                "type": reciprocal_type,
+            }
+        )
+    # Both rows go out in one multi-row INSERT; RETURNING order is not guaranteed, so the
+    # requested row is picked out by its from_person_id.
+    inserted = session.scalars(
+        insert(models.Relationship).returning(models.Relationship), rows
+    ).all()
+    return next(row for row in inserted if row.from_person_id == payload.from_person_id)
 
 
 def update_relationship(
@@ -117,53 +233,105 @@ def update_relationship(
         return relationship
 
     _remove_reciprocal(session, relationship)
-    relationship.type = payload.type
-    session.flush()
+    # The ORM-enabled UPDATE also syncs ``relationship.type`` in the session, so the
+    # reciprocal below is derived from the new type without an intermediate flush.
+    session.execute(
+        update(models.Relationship)
+        .where(models.Relationship.id == relationship.id)
+        .values(type=payload.type)
+    )
     _ensure_reciprocal(session, relationship)
-    session.flush()
     return relationship
 
 
-def delete_relationship(session: Session, relationship: models.Relationship) -> None:
+def delete_relationship(session: Session, relationship_id: int) -> None:
     """Remove a relationship and its reciprocal counterpart."""
 
-    _remove_reciprocal(session, relationship)
-    session.delete(relationship)
+    deleted = session.execute(
+        delete(models.Relationship)
+        .where(models.Relationship.id == relationship_id)
+        .returning(
+            models.Relationship.from_person_id,
+            models.Relationship.to_person_id,
+            models.Relationship.type,
+        )
+    ).one_or_none()
+    if deleted is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Relationship not found")
+    _remove_reciprocal(session, deleted)
+
+
+def delete_person(session: Session, person_id: int) -> None:
+    """Delete a person together with their relationships and location links."""
+
+    deleted_id = session.scalar(
+        delete(models.Person).where(models.Person.id == person_id).returning(models.Person.id)
+    )
+    if deleted_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
+    session.execute(
+        delete(models.Relationship).where(
+            or_(
+                models.Relationship.from_person_id == person_id,
+                models.Relationship.to_person_id == person_id,
+            )
+        )
+    )
+    session.execute(delete(models.PersonLocation).where(models.PersonLocation.person_id == person_id))
+
+
+def delete_location(session: Session, location_id: int) -> None:
+    """Delete a location and every person link that references it."""
+
+    deleted_id = session.scalar(
+        delete(models.Location)
+        .where(models.Location.id == location_id)
+        .returning(models.Location.id)
+    )
+    if deleted_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location not found")
+    session.execute(
+        delete(models.PersonLocation).where(models.PersonLocation.location_id == location_id)
+    )
 
 
 def _ensure_reciprocal(session: Session, relationship: models.Relationship) -> None:
-    reciprocal_type = RECIPROCAL_RELATIONSHIPS.get(relationship.type)
-    if reciprocal_type is None:
+    reciprocal_type = RECIPROCAL_RELATIONSHIPS[relationship.type]
+
+    values = {
+        "from_person_id": relationship.to_person_id,
+        "to_person_id": relationship.from_person_id,
+        "type": reciprocal_type,
+    }
+    dialect_insert = _CONFLICT_IGNORING_INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is not None:
+        session.execute(
+            dialect_insert(models.Relationship)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=["from_person_id", "to_person_id", "type"])
+        )
         return
 
     reciprocal_exists = session.scalar(
-        select(models.Relationship).where(
-            models.Relationship.from_person_id == relationship.to_person_id,
-            models.Relationship.to_person_id == relationship.from_person_id,
-            models.Relationship.type == reciprocal_type,
-        )
-    )
-    if reciprocal_exists is None:
-        session.add(
-            models.Relationship(
-                from_person_id=relationship.to_person_id,
-                to_person_id=relationship.from_person_id,
-                type=reciprocal_type,
+        select(
+            exists().where(
+                models.Relationship.from_person_id == relationship.to_person_id,
+                models.Relationship.to_person_id == relationship.from_person_id,
+                models.Relationship.type == reciprocal_type,
             )
         )
+    )
+    if not reciprocal_exists:
+        session.execute(insert(models.Relationship).values(**values))
 
 
 def _remove_reciprocal(session: Session, relationship: models.Relationship) -> None:
-    reciprocal_type = RECIPROCAL_RELATIONSHIPS.get(relationship.type)
-    if reciprocal_type is None:
-        return
+    reciprocal_type = RECIPROCAL_RELATIONSHIPS[relationship.type]
 
-    reciprocal = session.scalar(
-        select(models.Relationship).where(
+    session.execute(
+        delete(models.Relationship).where(
             models.Relationship.from_person_id == relationship.to_person_id,
             models.Relationship.to_person_id == relationship.from_person_id,
             models.Relationship.type == reciprocal_type,
         )
     )
-    if reciprocal is not None:
-        session.delete(reciprocal)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app import models
+from app import database, models
 from app.database import get_session
 from app.main import app
 
@@ -34,12 +36,39 @@ def session() -> Session:
         connection.close()
 
 
+@pytest.fixture(scope="session")
+def app_client() -> TestClient:
+    # Entering the client runs the app lifespan, so do it once for the whole run.
+    with TestClient(app) as client:
+        yield client
+
+
 @pytest.fixture()
-def client(session: Session) -> TestClient:
+def client(app_client: TestClient, session: Session) -> TestClient:
     def override_get_session():
         yield session
 
     app.dependency_overrides[get_session] = override_get_session
-    with TestClient(app) as client:
-        yield client
+    yield app_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def request_session_client(
+    app_client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> TestClient:
+    """Client whose requests open and close sessions through the real ``get_session``."""
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'family_tree.db'}",
+        connect_args={"check_same_thread": False},
+        future=True,
+    )
+    models.Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(
+        database,
+        "SessionLocal",
+        sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True),
+    )
+    yield app_client
+    engine.dispose()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 
 def test_family_endpoints_include_members(client: TestClient) -> None:
@@ -36,3 +38,41 @@ def test_family_endpoints_include_members(client: TestClient) -> None:
     assert any(item["id"] == family_id for item in listed_families)
     for item in listed_families:
         assert "members" in item
+
+
+def test_list_families_honours_if_none_match(client: TestClient) -> None:
+    assert client.post("/families", json={"name": "Etag"}).status_code == 201
+
+    first = client.get("/families")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = client.get("/families", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    assert client.post("/families", json={"name": "Etag Two"}).status_code == 201
+    refreshed = client.get("/families", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert len(refreshed.json()) == 2
+
+
+def test_update_family_is_one_statement(client: TestClient, session: Session) -> None:
+    family_id = client.post("/families", json={"name": "Before"}).json()["id"]
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    connection = session.get_bind()
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        response = client.put(f"/families/{family_id}", json={"name": "After"})
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.json() == {"id": family_id, "name": "After", "description": None}
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE families")
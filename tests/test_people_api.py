@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app import main, models
+
 
 def test_person_crud_flow(client: TestClient, session: Session) -> None:
     family_response = client.post("/families", json={"name": "Smith", "description": "Test family"})
@@ -176,3 +180,158 @@ def test_create_person_with_nested_family_and_locations(
     location_lookup = client.get(f"/locations/{new_location_id}")
     assert location_lookup.status_code == 200
     assert location_lookup.json()["name"] == "Gotham General"
+
+
+def test_deleting_location_unlinks_people(client: TestClient, session: Session) -> None:
+    location = client.post("/locations", json={"name": "Old Farm"})
+    assert location.status_code == 201
+    location_id = location.json()["id"]
+
+    person = client.post(
+        "/people",
+        json={
+            "first_name": "Erin",
+            "last_name": "Moved",
+            "locations": [{"role": "residence", "location_id": location_id}],
+        },
+    )
+    assert person.status_code == 201
+    person_id = person.json()["id"]
+
+    assert client.delete(f"/locations/{location_id}").status_code == 204
+    assert client.delete(f"/locations/{location_id}").status_code == 404
+
+    assert client.get(f"/people/{person_id}").json()["locations"] == []
+
+
+def test_list_people_streams_every_batch_from_request_session(
+    request_session_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(main, "_STREAM_BATCH_SIZE", 2)
+    created_ids = [
+        request_session_client.post(
+            "/people", json={"first_name": f"Streamed{index}", "last_name": "Batch"}
+        ).json()["id"]
+        for index in range(5)
+    ]
+
+    response = request_session_client.get("/people")
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == created_ids
+
+
+def test_invalid_location_assignment_reports_one_error_per_problem(
+    client: TestClient, session: Session
+) -> None:
+    response = client.post(
+        "/people",
+        json={
+            "first_name": "Ivy",
+            "last_name": "Invalid",
+            "locations": [
+                {"role": "birthplace", "new_location": {"name": "Clinic"}},
+                {"role": "hometown", "location_id": 1},
+                {"role": "burial"},
+            ],
+        },
+    )
+
+    assert response.status_code == 422
+    assert [(error["loc"], error["msg"]) for error in response.json()["detail"]] == [
+        (
+            ["body", "locations", 1, "role"],
+            "Input should be 'birthplace', 'residence' or 'burial'",
+        ),
+        (
+            ["body", "locations", 2],
+            "Value error, Either location_id or new_location must be provided",
+        ),
+    ]
+
+
+def test_update_person_drops_changes_and_adds_roles_together(
+    client: TestClient, session: Session
+) -> None:
+    location_ids = [
+        client.post("/locations", json={"name": name}).json()["id"]
+        for name in ("First Home", "Second Home", "Churchyard")
+    ]
+    first_id, second_id, churchyard_id = location_ids
+    person = client.post(
+        "/people",
+        json={
+            "first_name": "Gale",
+            "last_name": "Mover",
+            "locations": [
+                {"role": "birthplace", "location_id": first_id},
+                {"role": "residence", "location_id": first_id},
+            ],
+        },
+    )
+    assert person.status_code == 201
+    person_id = person.json()["id"]
+
+    response = client.put(
+        f"/people/{person_id}",
+        json={
+            "locations": [
+                {"role": "residence", "location_id": second_id},
+                {"role": "burial", "location_id": churchyard_id},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    expected = {"residence": second_id, "burial": churchyard_id}
+    for body in (response.json(), client.get(f"/people/{person_id}").json()):
+        assert {link["role"]: link["location"]["id"] for link in body["locations"]} == expected
+
+
+def test_create_person_body_is_a_named_openapi_component(client: TestClient) -> None:
+    openapi = client.get("/openapi.json").json()
+
+    request_body = openapi["paths"]["/people"]["post"]["requestBody"]
+    assert request_body["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/PersonCreate"
+    }
+    person_create = openapi["components"]["schemas"]["PersonCreate"]
+    assert person_create["required"] == ["first_name", "last_name"]
+    assert "$defs" not in person_create
+
+
+@pytest.mark.parametrize(
+    ("content_type", "content", "expected_type", "expected_loc"),
+    [
+        ("application/json", b"", "missing", ["body"]),
+        ("application/json", b"{not json", "json_invalid", ["body"]),
+        ("application/json", b'{"first_name": "Solo"}', "missing", ["body", "last_name"]),
+        (
+            "application/json",
+            b'{"first_name": "Bad", "last_name": "Date", "birth_date": "soon"}',
+            "date_from_datetime_parsing",
+            ["body", "birth_date"],
+        ),
+        (
+            "text/plain",
+            b'{"first_name": "Simple", "last_name": "Post"}',
+            "model_attributes_type",
+            ["body"],
+        ),
+    ],
+)
+def test_create_person_rejects_invalid_bodies_with_422(
+    client: TestClient,
+    session: Session,
+    content_type: str,
+    content: bytes,
+    expected_type: str,
+    expected_loc: list,
+) -> None:
+    response = client.post("/people", content=content, headers={"Content-Type": content_type})
+
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert [(error["type"], error["loc"]) for error in errors] == [(expected_type, expected_loc)]
+    assert all("url" not in error for error in errors)
+    assert session.scalars(select(models.Person)).all() == []
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import main, models, services
 
 
 def _create_person(client: TestClient, first_name: str, last_name: str) -> int:
@@ -54,3 +59,158 @@ def test_relationship_bidirectional_flow(client: TestClient) -> None:
 
     list_after_delete = client.get("/relationships")
     assert list_after_delete.json() == []
+
+
+def test_deleting_person_removes_their_relationships(client: TestClient) -> None:
+    parent_id = _create_person(client, "Gone", "Example")
+    child_id = _create_person(client, "Stays", "Example")
+    response = client.post(
+        "/relationships",
+        json={"from_person_id": parent_id, "to_person_id": child_id, "type": "parent"},
+    )
+    assert response.status_code == 201
+
+    assert client.delete(f"/people/{parent_id}").status_code == 204
+    assert client.delete(f"/people/{parent_id}").status_code == 404
+
+    assert client.get("/relationships").json() == []
+    assert client.get(f"/people/{child_id}").status_code == 200
+
+
+def test_list_relationships_streams_every_batch_from_request_session(
+    request_session_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(main, "_STREAM_BATCH_SIZE", 2)
+    parent_id = _create_person(request_session_client, "Streamed", "Parent")
+    for index in range(3):
+        child_id = _create_person(request_session_client, f"Streamed{index}", "Child")
+        response = request_session_client.post(
+            "/relationships",
+            json={"from_person_id": parent_id, "to_person_id": child_id, "type": "parent"},
+        )
+        assert response.status_code == 201
+
+    response = request_session_client.get("/relationships")
+
+    assert response.status_code == 200
+    assert sorted(item["type"] for item in response.json()) == ["child"] * 3 + ["parent"] * 3
+
+
+def test_loaded_relationship_types_resolve_reciprocals(
+    client: TestClient, session: Session
+) -> None:
+    parent_id = _create_person(client, "Loaded", "Parent")
+    child_id = _create_person(client, "Loaded", "Child")
+    response = client.post(
+        "/relationships",
+        json={"from_person_id": parent_id, "to_person_id": child_id, "type": "parent"},
+    )
+    assert response.status_code == 201
+
+    session.expire_all()
+    loaded_types = sorted(session.scalars(select(models.Relationship.type)))
+
+    # Types load as plain strings that still key the enum-keyed reciprocal mapping.
+    assert loaded_types == [models.RelationshipType.child, models.RelationshipType.parent]
+    assert [services.RECIPROCAL_RELATIONSHIPS[value] for value in loaded_types] == [
+        models.RelationshipType.parent,
+        models.RelationshipType.child,
+    ]
+
+
+def _relationship_rows(session: Session) -> dict[tuple[int, int, str], int]:
+    session.expire_all()
+    return {
+        (row.from_person_id, row.to_person_id, row.type): row.id
+        for row in session.scalars(select(models.Relationship))
+    }
+
+
+def test_create_relationship_keeps_existing_reciprocal(
+    client: TestClient, session: Session
+) -> None:
+    parent_id = _create_person(client, "Late", "Parent")
+    child_id = _create_person(client, "Early", "Child")
+    reciprocal = models.Relationship(
+        from_person_id=child_id, to_person_id=parent_id, type=models.RelationshipType.child
+    )
+    session.add(reciprocal)
+    session.flush()
+
+    response = client.post(
+        "/relationships",
+        json={"from_person_id": parent_id, "to_person_id": child_id, "type": "parent"},
+    )
+
+    assert response.status_code == 201
+    created = response.json()
+    assert (created["from_person_id"], created["to_person_id"], created["type"]) == (
+        parent_id,
+        child_id,
+        "parent",
+    )
+    assert _relationship_rows(session) == {
+        (parent_id, child_id, "parent"): created["id"],
+        (child_id, parent_id, "child"): reciprocal.id,
+    }
+
+    duplicate = client.post(
+        "/relationships",
+        json={"from_person_id": parent_id, "to_person_id": child_id, "type": "parent"},
+    )
+    assert duplicate.status_code == 409
+
+
+def test_update_relationship_retypes_and_replaces_reciprocal(
+    client: TestClient, session: Session
+) -> None:
+    first_id = _create_person(client, "First", "Retyped")
+    second_id = _create_person(client, "Second", "Retyped")
+    relationship_id = client.post(
+        "/relationships",
+        json={"from_person_id": first_id, "to_person_id": second_id, "type": "parent"},
+    ).json()["id"]
+
+    unchanged = client.put(f"/relationships/{relationship_id}", json={"type": "parent"})
+    assert unchanged.status_code == 200
+    assert unchanged.json()["type"] == "parent"
+
+    retyped = client.put(f"/relationships/{relationship_id}", json={"type": "child"})
+    assert retyped.status_code == 200
+    assert retyped.json() == {
+        "id": relationship_id,
+        "from_person_id": first_id,
+        "to_person_id": second_id,
+        "type": "child",
+    }
+    rows = _relationship_rows(session)
+    assert set(rows) == {(first_id, second_id, "child"), (second_id, first_id, "parent")}
+    assert rows[(first_id, second_id, "child")] == relationship_id
+
+    missing = client.put("/relationships/9999", json={"type": "spouse"})
+    assert missing.status_code == 404
+
+
+def test_update_relationship_reuses_existing_new_reciprocal(
+    client: TestClient, session: Session
+) -> None:
+    first_id = _create_person(client, "First", "Spouse")
+    second_id = _create_person(client, "Second", "Spouse")
+    relationship_id = client.post(
+        "/relationships",
+        json={"from_person_id": first_id, "to_person_id": second_id, "type": "parent"},
+    ).json()["id"]
+    spouse_reciprocal = models.Relationship(
+        from_person_id=second_id, to_person_id=first_id, type=models.RelationshipType.spouse
+    )
+    session.add(spouse_reciprocal)
+    session.flush()
+
+    response = client.put(f"/relationships/{relationship_id}", json={"type": "spouse"})
+
+    assert response.status_code == 200
+    assert response.json()["type"] == "spouse"
+    assert _relationship_rows(session) == {
+        (first_id, second_id, "spouse"): relationship_id,
+        (second_id, first_id, "spouse"): spouse_reciprocal.id,
+    }
@@ -33,3 +33,29 @@ def test_submit_person_form_does_not_create_aux_records_on_error(
 
     assert families == []
     assert locations == []
+
+
+def test_submit_person_form_creates_person_with_inline_records(
+    client: TestClient, session: Session
+) -> None:
+    response = client.post(
+        "/ui/people",
+        data={
+            "first_name": "Dana",
+            "last_name": "Inline",
+            "birth_date": "1980-05-04",
+            "new_family_name": "Inline Family",
+            "birthplace_location_name": "Harbor Clinic",
+            "birthplace_location_city": "Port Town",
+        },
+    )
+
+    assert response.status_code == 200
+    assert "Created Dana Inline." in response.text
+
+    person = session.scalars(select(models.Person)).one()
+    assert person.family is not None
+    assert person.family.name == "Inline Family"
+    assert [(link.role, link.location.name) for link in person.locations.values()] == [
+        (models.LocationRole.birthplace, "Harbor Clinic")
+    ]